@@ -0,0 +1,38 @@
+"""
+One-off migration: add the "_search" key to documents stored before it existed.
+
+New documents get the key from create_document/create_documents, so this only
+needs to run once against an existing database:
+
+    python backfill_search_keys.py
+"""
+
+from pymongo import UpdateOne
+
+from database import db, find_cursor, search_key, SEARCH_FIELDS, FIND_BATCH_SIZE
+
+# Collections the API filters by q
+SEARCHABLE = ("device", "event", "healthrecord")
+
+def backfill(collection_name: str) -> int:
+    """Compute search_key() for documents missing "_search" and write it back in batches"""
+    projection = {f: 1 for f in SEARCH_FIELDS}
+    modified = 0
+    ops = []
+    for doc in find_cursor(collection_name, {"_search": {"$exists": False}}, projection=projection):
+        ops.append(UpdateOne({"_id": doc["_id"]}, {"$set": {"_search": search_key(doc)}}))
+        if len(ops) >= FIND_BATCH_SIZE:
+            modified += db[collection_name].bulk_write(ops, ordered=False).modified_count
+            ops = []
+    if ops:
+        modified += db[collection_name].bulk_write(ops, ordered=False).modified_count
+    return modified
+
+def main():
+    if db is None:
+        raise SystemExit("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
+    for collection in SEARCHABLE:
+        print(f"{collection}: {backfill(collection)} documents updated")
+
+if __name__ == "__main__":
+    main()
@@ -9,7 +9,7 @@ from pymongo import MongoClient
 from datetime import datetime, timezone
 import os
 from dotenv import load_dotenv
-from typing import Union
+from typing import List, Optional, Union
 from pydantic import BaseModel
 
 # Load environment variables from .env file
@@ -25,31 +25,104 @@ if database_url and database_name:
     _client = MongoClient(database_url)
     db = _client[database_name]
 
-# Helper functions for common database operations
-def create_document(collection_name: str, data: Union[BaseModel, dict]):
-    """Insert a single document with timestamp"""
-    if db is None:
-        raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
+# Documents per getMore round-trip when iterating cursors
+FIND_BATCH_SIZE = 500
+
+# Fields concatenated into the lowercase "_search" key used for q filtering
+SEARCH_FIELDS = ("device_id", "driver_name", "name")
 
+def search_key(data_dict: dict) -> str:
+    """Build the lowercase search key stored alongside a document"""
+    return " ".join("" if data_dict.get(f) is None else str(data_dict[f]) for f in SEARCH_FIELDS).lower()
+
+def _prepare_document(data: Union[BaseModel, dict], now: datetime) -> dict:
+    """Build the stored document: plain dict with timestamps and search key"""
     # Convert Pydantic model to dict if needed
     if isinstance(data, BaseModel):
         data_dict = data.model_dump()
     else:
         data_dict = data.copy()
 
-    data_dict['created_at'] = datetime.now(timezone.utc)
-    data_dict['updated_at'] = datetime.now(timezone.utc)
+    data_dict['created_at'] = now
+    data_dict['updated_at'] = now
+    if any(f in data_dict for f in SEARCH_FIELDS):
+        data_dict['_search'] = search_key(data_dict)
+    return data_dict
+
+# Helper functions for common database operations
+def create_document(collection_name: str, data: Union[BaseModel, dict]):
+    """Insert a single document with timestamp"""
+    if db is None:
+        raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
 
-    result = db[collection_name].insert_one(data_dict)
+    result = db[collection_name].insert_one(_prepare_document(data, datetime.now(timezone.utc)))
     return str(result.inserted_id)
 
-def get_documents(collection_name: str, filter_dict: dict = None, limit: int = None):
-    """Get documents from collection"""
+def create_documents(collection_name: str, items: List[Union[BaseModel, dict]]):
+    """Insert multiple documents with timestamps in a single round-trip"""
     if db is None:
         raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
-    
-    cursor = db[collection_name].find(filter_dict or {})
+
+    now = datetime.now(timezone.utc)
+    result = db[collection_name].insert_many([_prepare_document(data, now) for data in items])
+    return [str(i) for i in result.inserted_ids]
+
+def find_cursor(collection_name: str, filter_dict: dict = None, limit: int = None, skip: int = 0,
+                projection: dict = None, sort: list = None):
+    """Get a lazy cursor over documents from collection"""
+    if db is None:
+        raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
+
+    cursor = db[collection_name].find(filter_dict or {}, projection).batch_size(FIND_BATCH_SIZE)
+    if sort:
+        cursor = cursor.sort(sort)
+    if skip:
+        cursor = cursor.skip(skip)
     if limit:
         cursor = cursor.limit(limit)
-    
-    return list(cursor)
+
+    return cursor
+
+def get_documents(collection_name: str, filter_dict: dict = None, limit: int = None, skip: int = 0,
+                  projection: dict = None, sort: list = None):
+    """Get documents from collection"""
+    return list(find_cursor(collection_name, filter_dict, limit=limit, skip=skip, projection=projection, sort=sort))
+
+def get_one(collection_name: str, filter_dict: dict = None, sort: list = None) -> Optional[dict]:
+    """Get the first document matching filter (None if there is none)"""
+    if db is None:
+        raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
+
+    return db[collection_name].find_one(filter_dict or {}, sort=sort)
+
+def count_documents(collection_name: str, filter_dict: dict = None):
+    """Count documents in collection matching filter"""
+    if db is None:
+        raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
+
+    return db[collection_name].count_documents(filter_dict or {})
+
+def create_index(collection_name: str, keys, **kwargs):
+    """Create an index on collection (no-op if it already exists)"""
+    if db is None:
+        raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
+
+    return db[collection_name].create_index(keys, **kwargs)
+
+def aggregate_cursor(collection_name: str, pipeline: list):
+    """Get a lazy cursor over the results of an aggregation pipeline"""
+    if db is None:
+        raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
+
+    return db[collection_name].aggregate(pipeline, batchSize=FIND_BATCH_SIZE)
+
+def aggregate_documents(collection_name: str, pipeline: list):
+    """Run an aggregation pipeline on collection"""
+    return list(aggregate_cursor(collection_name, pipeline))
+
+def collection_empty(collection_name: str) -> bool:
+    """Check whether collection has no documents (uses collection metadata)"""
+    if db is None:
+        raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
+
+    return db[collection_name].estimated_document_count() == 0
@@ -1,15 +1,74 @@
+import asyncio
+import itertools
+import logging
+import math
 import os
-from datetime import datetime, timedelta
-from typing import List, Optional
-
+import re
+import threading
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, get_args
+
+import orjson
+from cachetools import TTLCache
 from fastapi import FastAPI, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 
-from database import db, create_document, get_documents
+from database import (
+    db, create_documents, get_documents, get_one, find_cursor, count_documents, create_index, aggregate_documents,
+    aggregate_cursor, collection_empty,
+)
 from schemas import Driver, Device, HealthRecord, SleepRecord, Event, User
 
-app = FastAPI(title="Smart Wearable Platform API")
+logger = logging.getLogger(__name__)
+
+# Indexes backing the dashboard queries, created at startup: (collection, keys)
+_INDEXES = [
+    ("healthrecord", [("bp_systolic", 1)]),
+    ("healthrecord", [("bp_diastolic", 1)]),
+    ("sleeprecord", [("date", 1), ("score", 1)]),
+    ("sleeprecord", [("date", 1), ("duration_minutes", 1)]),
+    ("device", [("is_online", 1)]),
+    ("sleeprecord", [("driver_id", 1), ("date", -1)]),
+    ("event", [("device_id", 1), ("timestamp", -1)]),
+    ("healthrecord", [("device_id", 1), ("timestamp", -1)]),
+    ("device", [("_search", 1)]),
+    ("event", [("_search", 1)]),
+    ("healthrecord", [("_search", 1)]),
+    ("healthrecord", [("timestamp", -1), ("_id", 1)]),
+    ("device", [("device_id", 1), ("_id", 1)]),
+    ("event", [("timestamp", -1), ("_id", -1)]),
+    # Covers events_table filtered by status_event: equality, sort (incl. _id tie-breaker) and every projected field
+    ("event", [
+        ("status_event", 1), ("timestamp", -1), ("_id", -1),
+        ("driver_name", 1), ("device_id", 1), ("location.address", 1),
+    ]),
+]
+
+def ensure_indexes():
+    if db is None:
+        return
+    try:
+        for collection, keys in _INDEXES:
+            create_index(collection, keys)
+    except Exception:
+        # Serve anyway: /test reports the database state, and queries still work without indexes
+        logger.exception("Could not create MongoDB indexes")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build indexes in the background so an unreachable database doesn't hold up startup
+    # for the server selection timeout
+    index_task = asyncio.create_task(run_in_threadpool(ensure_indexes))
+    yield
+    if not index_task.done():
+        index_task.cancel()
+
+app = FastAPI(title="Smart Wearable Platform API", default_response_class=ORJSONResponse, lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -38,12 +97,69 @@ def login(req: LoginRequest):
     # Demo login: accept any email/password, issue a fake token
     # In real scenario, validate against User collection with password hashing
     name = req.email.split("@")[0].title()
-    return LoginResponse(token="demo-token", name=name, role="admin")
+    return LoginResponse.model_construct(token="demo-token", name=name, role="admin")
 
 # ------------------------- Helpers -------------------------
 
-def to_collection(name: str) -> str:
-    return name.lower()
+# Current UTC day number and its YYYY-MM-DD string, recomputed on day change
+_today_day = None
+_today_str = None
+
+def today_str() -> str:
+    """Today's UTC date as YYYY-MM-DD, formatted once per day."""
+    global _today_day, _today_str
+    now = time.time()
+    day = int(now // 86400)
+    if day != _today_day:
+        _today_str = time.strftime("%Y-%m-%d", time.gmtime(now))
+        _today_day = day
+    return _today_str
+
+def search_filter(q: str) -> dict:
+    """Substring match of q against the stored lowercase search key."""
+    return {"_search": {"$regex": re.escape(q.lower())}}
+
+def stream_items(cursor, transform=None) -> StreamingResponse:
+    """Stream {"items": [...]} straight from a cursor without building the full list."""
+    dump = (lambda doc: orjson.dumps(transform(doc))) if transform else orjson.dumps
+    # Pull and serialize the first document here so query, connection and encoding
+    # errors surface as a 500 from the handler instead of a 200 with a truncated body
+    try:
+        first = next(cursor, None)
+        head = b'{"items":[]}' if first is None else b'{"items":[' + dump(first)
+    except Exception:
+        cursor.close()
+        raise
+
+    def gen():
+        try:
+            yield head
+            if first is None:
+                return
+            for doc in cursor:
+                yield b"," + dump(doc)
+            yield b"]}"
+        finally:
+            cursor.close()
+    return StreamingResponse(gen(), media_type="application/json")
+
+# Short-lived cache for dashboard responses that UIs poll repeatedly
+_DASH_CACHE = TTLCache(maxsize=128, ttl=10)
+_DASH_CACHE_LOCK = threading.Lock()
+
+def cached_dashboard(key: tuple, compute):
+    """Return the cached value for key, computing and storing it on a miss."""
+    with _DASH_CACHE_LOCK:
+        value = _DASH_CACHE.get(key)
+    if value is None:
+        value = compute()
+        with _DASH_CACHE_LOCK:
+            _DASH_CACHE[key] = value
+    return value
+
+# Canonical status_event values keyed by lowercase, so filters stay case-insensitive
+# while still matching with an exact (indexable) equality
+_STATUS_EVENTS = {s.lower(): s for s in get_args(Event.model_fields["status_event"].annotation)}
 
 # ------------------------- Seed/Test Data -------------------------
 
@@ -51,66 +167,70 @@ def to_collection(name: str) -> str:
 def seed():
     """Seed minimal demo data if collections are empty."""
     # Create a couple drivers/devices
-    if len(get_documents(to_collection("driver"))) == 0:
+    if collection_empty("driver"):
         d1 = Driver(name="Budi Santoso", employee_id="DRV001", phone="081234567890")
         d2 = Driver(name="Siti Aminah", employee_id="DRV002", phone="081298765432")
-        create_document(to_collection("driver"), d1)
-        create_document(to_collection("driver"), d2)
+        create_documents("driver", [d1, d2])
 
-    if len(get_documents(to_collection("device"))) == 0:
+    if collection_empty("device"):
         dev1 = Device(device_id="DEV-1001", driver_name="Budi Santoso", is_online=True, battery=87,
                       last_location={"lat": -6.2, "lng": 106.82, "address": "Jakarta"})
         dev2 = Device(device_id="DEV-1002", driver_name="Siti Aminah", is_online=False, battery=22,
                       last_location={"lat": -6.21, "lng": 106.85, "address": "Jakarta"})
-        create_document(to_collection("device"), dev1)
-        create_document(to_collection("device"), dev2)
+        create_documents("device", [dev1, dev2])
 
     # Health records (latest)
-    today = datetime.utcnow()
-    if len(get_documents(to_collection("healthrecord"))) == 0:
+    now = datetime.now(timezone.utc)
+    today = now.strftime("%Y-%m-%d")
+
+    def segments(spec):
+        # spec: ((hours, minutes) ago start, (hours, minutes) ago end, type)
+        return [
+            {"start": now - timedelta(hours=sh, minutes=sm), "end": now - timedelta(hours=eh, minutes=em), "type": kind}
+            for (sh, sm), (eh, em), kind in spec
+        ]
+
+    if collection_empty("healthrecord"):
         hr1 = HealthRecord(
-            driver_id="DRV001", driver_name="Budi Santoso", device_id="DEV-1001", timestamp=today,
+            driver_id="DRV001", driver_name="Budi Santoso", device_id="DEV-1001", timestamp=now,
             heart_rate=78, bp_systolic=145, bp_diastolic=95, temperature=36.8, calories=1200,
             steps=9500, duration_minutes=75, kilometers=6.8
         )
         hr2 = HealthRecord(
-            driver_id="DRV002", driver_name="Siti Aminah", device_id="DEV-1002", timestamp=today,
+            driver_id="DRV002", driver_name="Siti Aminah", device_id="DEV-1002", timestamp=now,
             heart_rate=82, bp_systolic=118, bp_diastolic=78, temperature=36.6, calories=980,
             steps=7200, duration_minutes=60, kilometers=4.9
         )
-        create_document(to_collection("healthrecord"), hr1)
-        create_document(to_collection("healthrecord"), hr2)
+        create_documents("healthrecord", [hr1, hr2])
 
     # Sleep per day
-    if len(get_documents(to_collection("sleeprecord"))) == 0:
+    if collection_empty("sleeprecord"):
         s1 = SleepRecord(
-            driver_id="DRV001", driver_name="Budi Santoso", device_id="DEV-1001", date=today.strftime("%Y-%m-%d"),
-            score=58, duration_minutes=320, segments=[
-                {"start": today - timedelta(hours=7), "end": today - timedelta(hours=6, minutes=45), "type": "light"},
-                {"start": today - timedelta(hours=6, minutes=45), "end": today - timedelta(hours=5), "type": "deep"},
-                {"start": today - timedelta(hours=5), "end": today - timedelta(hours=4, minutes=30), "type": "rem"},
-                {"start": today - timedelta(hours=4, minutes=30), "end": today - timedelta(hours=4, minutes=15), "type": "awake"}
-            ]
+            driver_id="DRV001", driver_name="Budi Santoso", device_id="DEV-1001", date=today,
+            score=58, duration_minutes=320, segments=segments((
+                ((7, 0), (6, 45), "light"),
+                ((6, 45), (5, 0), "deep"),
+                ((5, 0), (4, 30), "rem"),
+                ((4, 30), (4, 15), "awake"),
+            ))
         )
         s2 = SleepRecord(
-            driver_id="DRV002", driver_name="Siti Aminah", device_id="DEV-1002", date=today.strftime("%Y-%m-%d"),
-            score=82, duration_minutes=420, segments=[
-                {"start": today - timedelta(hours=8), "end": today - timedelta(hours=6), "type": "deep"},
-                {"start": today - timedelta(hours=6), "end": today - timedelta(hours=5), "type": "light"},
-                {"start": today - timedelta(hours=5), "end": today - timedelta(hours=4), "type": "rem"}
-            ]
+            driver_id="DRV002", driver_name="Siti Aminah", device_id="DEV-1002", date=today,
+            score=82, duration_minutes=420, segments=segments((
+                ((8, 0), (6, 0), "deep"),
+                ((6, 0), (5, 0), "light"),
+                ((5, 0), (4, 0), "rem"),
+            ))
         )
-        create_document(to_collection("sleeprecord"), s1)
-        create_document(to_collection("sleeprecord"), s2)
+        create_documents("sleeprecord", [s1, s2])
 
     # Events
-    if len(get_documents(to_collection("event"))) == 0:
-        e1 = Event(driver_id="DRV001", driver_name="Budi Santoso", device_id="DEV-1001", timestamp=today,
+    if collection_empty("event"):
+        e1 = Event(driver_id="DRV001", driver_name="Budi Santoso", device_id="DEV-1001", timestamp=now,
                    status_event="Low Battery", location={"lat": -6.2, "lng": 106.82, "address": "Jakarta"})
-        e2 = Event(driver_id="DRV002", driver_name="Siti Aminah", device_id="DEV-1002", timestamp=today,
+        e2 = Event(driver_id="DRV002", driver_name="Siti Aminah", device_id="DEV-1002", timestamp=now,
                    status_event="SOS", location={"lat": -6.21, "lng": 106.85, "address": "Jakarta"})
-        create_document(to_collection("event"), e1)
-        create_document(to_collection("event"), e2)
+        create_documents("event", [e1, e2])
 
     return {"status": "ok"}
 
@@ -130,24 +250,31 @@ def dashboard_summary(
     sleep_score_threshold: int = Query(60),
     sleep_duration_threshold: int = Query(360)  # minutes
 ):
-    today = datetime.utcnow().strftime("%Y-%m-%d")
-
-    health = get_documents(to_collection("healthrecord"))
-    sleep = get_documents(to_collection("sleeprecord"), {"date": today})
-    devices = get_documents(to_collection("device"))
-
-    high_bp = [h for h in health if h.get("bp_systolic", 0) > bp_sys_threshold or h.get("bp_diastolic", 0) > bp_dia_threshold]
-    low_sleep_score = [s for s in sleep if s.get("score", 0) < sleep_score_threshold]
-    under_sleep = [s for s in sleep if s.get("duration_minutes", 0) < sleep_duration_threshold]
-    online = [d for d in devices if d.get("is_online")]
-    offline = [d for d in devices if not d.get("is_online")]
-
-    return DashboardSummary(
-        high_bp_count=len(high_bp),
-        low_sleep_score_count=len(low_sleep_score),
-        under_sleep_duration_count=len(under_sleep),
-        online_devices=len(online),
-        offline_devices=len(offline),
+    key = ("summary", bp_sys_threshold, bp_dia_threshold, sleep_score_threshold, sleep_duration_threshold)
+    return cached_dashboard(key, lambda: _dashboard_summary(
+        bp_sys_threshold, bp_dia_threshold, sleep_score_threshold, sleep_duration_threshold
+    ))
+
+def _dashboard_summary(bp_sys_threshold: int, bp_dia_threshold: int, sleep_score_threshold: int,
+                       sleep_duration_threshold: int) -> DashboardSummary:
+    today = today_str()
+
+    high_bp = count_documents("healthrecord", {"$or": [
+        {"bp_systolic": {"$gt": bp_sys_threshold}},
+        {"bp_diastolic": {"$gt": bp_dia_threshold}},
+    ]})
+    low_sleep_score = count_documents("sleeprecord", {"date": today, "score": {"$lt": sleep_score_threshold}})
+    under_sleep = count_documents("sleeprecord", {"date": today, "duration_minutes": {"$lt": sleep_duration_threshold}})
+    online = count_documents("device", {"is_online": True})
+    offline = count_documents("device", {"is_online": {"$ne": True}})
+
+    # Fields are produced here, so skip validation
+    return DashboardSummary.model_construct(
+        high_bp_count=high_bp,
+        low_sleep_score_count=low_sleep_score,
+        under_sleep_duration_count=under_sleep,
+        online_devices=online,
+        offline_devices=offline,
     )
 
 # Table A: Driver daily readiness
@@ -160,103 +287,158 @@ class DriverReadiness(BaseModel):
     last_bp_diastolic: int
     status: str  # approved or not approved
 
-@app.get("/dashboard/readiness")
-def driver_readiness(q: Optional[str] = None, status: Optional[str] = None):
-    health = get_documents(to_collection("healthrecord"))
-    sleep = get_documents(to_collection("sleeprecord"))
-    sleep_by_driver = {}
-    for s in sleep:
-        sleep_by_driver[s["driver_id"]] = s
-    rows = []
-    for h in health:
-        s = sleep_by_driver.get(h["driver_id"]) or {}
-        readiness_ok = h.get("bp_systolic",0) < 140 and h.get("bp_diastolic",0) < 90 and s.get("score",100) >= 60
-        row = {
-            "datetime": h.get("timestamp"),
-            "driver_name": h.get("driver_name"),
-            "device_id": h.get("device_id"),
-            "last_sleep_score": s.get("score"),
-            "last_bp_systolic": h.get("bp_systolic"),
-            "last_bp_diastolic": h.get("bp_diastolic"),
-            "status": "approved" if readiness_ok else "not approved"
-        }
-        rows.append(row)
+# Static part of the readiness pipeline: join the driver's latest sleep, then derive status
+_READINESS_STAGES = [
+    {"$lookup": {
+        "from": "sleeprecord",
+        "let": {"d": "$driver_id"},
+        "pipeline": [
+            {"$match": {"$expr": {"$eq": ["$driver_id", "$$d"]}}},
+            {"$sort": {"date": -1}},
+            {"$limit": 1},
+            {"$project": {"_id": 0, "score": 1}},
+        ],
+        "as": "s",
+    }},
+    {"$addFields": {
+        "s": {"$arrayElemAt": ["$s", 0]},
+    }},
+    # Missing metrics default the same way as the old per-row dict.get() calls
+    {"$addFields": {
+        "status": {"$cond": [
+            {"$and": [
+                {"$lt": [{"$ifNull": ["$bp_systolic", 0]}, 140]},
+                {"$lt": [{"$ifNull": ["$bp_diastolic", 0]}, 90]},
+                {"$gte": [{"$ifNull": ["$s.score", 100]}, 60]},
+            ]},
+            "approved",
+            "not approved",
+        ]},
+    }},
+]
+
+_READINESS_PROJECT = {"$project": {
+    "_id": 0,
+    "datetime": "$timestamp",
+    "driver_name": 1,
+    "device_id": 1,
+    "last_sleep_score": {"$ifNull": ["$s.score", None]},
+    "last_bp_systolic": "$bp_systolic",
+    "last_bp_diastolic": "$bp_diastolic",
+    "status": 1,
+}}
 
+@app.get("/dashboard/readiness")
+def driver_readiness(
+    q: Optional[str] = None,
+    status: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    skip: int = Query(0, ge=0),
+):
+    pipeline = []
     if q:
-        rows = [r for r in rows if q.lower() in (r["driver_name"] or "").lower()]
+        pipeline.append({"$match": search_filter(q)})
+    # Deterministic, index-backed order so skip/limit pages neither repeat nor drop rows;
+    # $lookup/$addFields/$match below keep this order
+    pipeline.append({"$sort": {"timestamp": -1, "_id": 1}})
+    page = ([{"$skip": skip}] if skip else []) + [{"$limit": limit}]
     if status:
-        rows = [r for r in rows if r["status"].lower() == status.lower()]
+        pipeline += _READINESS_STAGES
+        pipeline.append({"$match": {"status": status.lower()}})
+        pipeline += page
+    else:
+        # Without a status filter, page first so only the returned rows are joined
+        pipeline += page
+        pipeline += _READINESS_STAGES
+    pipeline.append(_READINESS_PROJECT)
 
-    return {"items": rows}
+    return stream_items(aggregate_cursor("healthrecord", pipeline))
 
 # Table B: Event summary
 @app.get("/dashboard/events")
-def events_table(q: Optional[str] = None, status_event: Optional[str] = None):
-    events = get_documents(to_collection("event"))
-    rows = []
-    for e in events:
-        rows.append({
-            "datetime": e.get("timestamp"),
-            "driver_name": e.get("driver_name"),
-            "device_id": e.get("device_id"),
-            "status_event": e.get("status_event"),
-            "address": (e.get("location") or {}).get("address")
-        })
+def events_table(
+    q: Optional[str] = None,
+    status_event: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    skip: int = Query(0, ge=0),
+):
+    filt = {}
     if q:
-        rows = [r for r in rows if q.lower() in (r["driver_name"] or "").lower()]
+        filt.update(search_filter(q))
     if status_event:
-        rows = [r for r in rows if r["status_event"].lower() == status_event.lower()]
-    return {"items": rows}
+        filt["status_event"] = _STATUS_EVENTS.get(status_event.lower(), status_event)
+    # With only a status_event filter this is served from the covering event index (no document fetch)
+    events = find_cursor("event", filt, limit=limit, skip=skip, sort=[("timestamp", -1), ("_id", -1)], projection={
+        "_id": 0, "timestamp": 1, "driver_name": 1, "device_id": 1, "status_event": 1, "location.address": 1,
+    })
+    return stream_items(events, lambda e: {
+        "datetime": e.get("timestamp"),
+        "driver_name": e.get("driver_name"),
+        "device_id": e.get("device_id"),
+        "status_event": e.get("status_event"),
+        "address": (e.get("location") or {}).get("address")
+    })
 
 # Map view points
 @app.get("/dashboard/map")
 def map_points():
-    devices = get_documents(to_collection("device"))
-    health = get_documents(to_collection("healthrecord"))
-    events = get_documents(to_collection("event"))
-    health_by_device = {h["device_id"]: h for h in health}
-    latest_event_by_device = {}
-    for e in events:
-        latest_event_by_device[e["device_id"]] = e
-
-    points = []
-    for d in devices:
-        loc = d.get("last_location") or {}
-        h = health_by_device.get(d.get("device_id")) or {}
-        ev = latest_event_by_device.get(d.get("device_id")) or {}
-        points.append({
-            "device_id": d.get("device_id"),
-            "driver_name": d.get("driver_name"),
-            "battery": d.get("battery"),
-            "event": ev.get("status_event"),
-            "address": loc.get("address"),
-            "lat": loc.get("lat"),
-            "lng": loc.get("lng"),
-        })
+    return cached_dashboard(("map",), _map_points)
+
+def _map_points():
+    points = aggregate_documents("device", [
+        {"$lookup": {
+            "from": "event",
+            "let": {"d": "$device_id"},
+            "pipeline": [
+                {"$match": {"$expr": {"$eq": ["$device_id", "$$d"]}}},
+                {"$sort": {"timestamp": -1}},
+                {"$limit": 1},
+                {"$project": {"_id": 0, "status_event": 1}},
+            ],
+            "as": "ev",
+        }},
+        {"$project": {
+            "_id": 0,
+            "device_id": 1,
+            "driver_name": {"$ifNull": ["$driver_name", None]},
+            "battery": {"$ifNull": ["$battery", None]},
+            "event": {"$ifNull": [{"$arrayElemAt": ["$ev.status_event", 0]}, None]},
+            "address": {"$ifNull": ["$last_location.address", None]},
+            "lat": {"$ifNull": ["$last_location.lat", None]},
+            "lng": {"$ifNull": ["$last_location.lng", None]},
+        }},
+    ])
     return {"items": points}
 
 # ------------------------- Devices -------------------------
 
 @app.get("/devices")
-def devices_list(q: Optional[str] = None):
-    devices = get_documents(to_collection("device"))
+def devices_list(
+    q: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    skip: int = Query(0, ge=0),
+):
+    filt = {}
     if q:
-        devices = [d for d in devices if q.lower() in (d.get("device_id", "")+" "+(d.get("driver_name","") or "")).lower()]
+        filt.update(search_filter(q))
+    devices = find_cursor("device", filt, limit=limit, skip=skip, sort=[("device_id", 1), ("_id", 1)], projection={
+        "_id": 0, "device_id": 1, "driver_name": 1, "battery": 1, "is_online": 1, "last_location": 1,
+    })
     # Add simple id
-    for i, d in enumerate(devices, start=1):
-        d["no"] = i
-    return {"items": devices}
+    numbers = itertools.count(skip + 1)
+    return stream_items(devices, lambda d: dict(d, no=next(numbers)))
 
 @app.get("/devices/{device_id}")
-def device_detail(device_id: str):
-    devices = get_documents(to_collection("device"), {"device_id": device_id})
-    if not devices:
+async def device_detail(device_id: str):
+    # The four reads are independent, so run them concurrently on the threadpool
+    device, health, sleep_today, events = await asyncio.gather(
+        run_in_threadpool(get_one, "device", {"device_id": device_id}),
+        run_in_threadpool(get_one, "healthrecord", {"device_id": device_id}, sort=[("timestamp", -1)]),
+        run_in_threadpool(get_documents, "sleeprecord", {"device_id": device_id}, limit=100, sort=[("date", -1)]),
+        run_in_threadpool(get_documents, "event", {"device_id": device_id}, limit=100, sort=[("timestamp", -1)]),
+    )
+    if device is None:
         raise HTTPException(status_code=404, detail="Device not found")
-    device = devices[0]
-    health = get_documents(to_collection("healthrecord"), {"device_id": device_id})
-    health = health[0] if health else None
-    sleep_today = get_documents(to_collection("sleeprecord"), {"device_id": device_id})
-    events = get_documents(to_collection("event"), {"device_id": device_id})
     return {"device": device, "health": health, "sleep": sleep_today, "events": events}
 
 # Sleep history list by device + date filters
@@ -265,17 +447,17 @@ def device_sleep(device_id: str, date: Optional[str] = None):
     filt = {"device_id": device_id}
     if date:
         filt["date"] = date
-    items = get_documents(to_collection("sleeprecord"), filt)
+    items = get_documents("sleeprecord", filt)
     return {"items": items}
 
 # ECG streaming simulation (returns small wave array)
+# Simple synthetic waveform; input-independent, so computed once at import
+_ECG_WAVE = tuple(int(50 + 30 * math.sin(i/6.0) + 10 * math.sin(i/1.3)) for i in range(60))
+
 @app.get("/devices/{device_id}/ecg")
 def device_ecg(device_id: str):
-    # Simple synthetic waveform
-    import math
-    now = datetime.utcnow()
-    points = [int(50 + 30 * math.sin(i/6.0) + 10 * math.sin(i/1.3)) for i in range(60)]
-    return {"timestamp": now.isoformat(), "samples": points}
+    now = datetime.now(timezone.utc)
+    return {"timestamp": now.isoformat(), "samples": _ECG_WAVE}
 
 # ------------------------- System -------------------------
 